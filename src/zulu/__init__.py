@@ -4,7 +4,7 @@ The zulu module.
 
 from .__version__ import __version__
 
-from .api import create, now, parse, parse_delta, range, span_range
+from .api import create, now, parse, parse_delta, parse_many, range, span_range
 from .zulu import Zulu
 from .parser import ParseError, ISO8601, TIMESTAMP
 from .delta import Delta, to_seconds
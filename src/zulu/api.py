@@ -30,6 +30,15 @@ def parse(*args, **kargs):
     return Zulu.parse(*args, **kargs)
 
 
+def parse_many(*args, **kargs):
+    """
+    Alias to :meth:`.Zulu.parse_many`.
+
+    .. seealso:: See :meth:`.Zulu.parse_many` for function signature details.
+    """
+    return Zulu.parse_many(*args, **kargs)
+
+
 def range(*args, **kargs):
     """
     Alias to :meth:`.Zulu.range`.
@@ -3,52 +3,27 @@ The timedelta module.
 """
 
 from datetime import timedelta
-from functools import wraps
+from functools import lru_cache
 
 from babel.core import default_locale
 
 from . import parser
 
 
-def _asdelta(func):
+@lru_cache(maxsize=None)
+def _default_locale():
     """
-    Simple decorator to convert return from timedelta.__<math>__ methods to Delta
-    object. This is primarily needed because one cannot simply override the existing
-    timedelta method due to the way the class is implemented. Doing so results in
-    slotted attributes not being available to the subclassed methods. Therefore, we need
-    to convert the returned timedelta to Delta instead.
-
-    Note:
-        We could reimplement all of the arithmetic magic methods but prefer not to.
-        However, we do end up creating timedelta objects twice (one from the timedelta
-        result, another when we create a new Delta) so there would be some performance
-        gains from doing so though.
+    Return the system's default ``LC_TIME`` locale. The result is cached since looking
+    it up requires parsing environment variables. Use ``_default_locale.cache_clear()``
+    to pick up environment changes.
     """
-    # NOTE: We're setting assigned because in Python 2.7, @wraps fails for certain
-    # timedelta magic methods due to certain attributes missing from the timedelta class
-    # that @wraps looks for by default.
-    @wraps(func, assigned=("__name__", "__doc__"))
-    def decorated(*args, **kargs):
-        result = func(*args, **kargs)
-
-        if isinstance(result, timedelta):
-            return Delta.fromtimedelta(result)
-        elif isinstance(result, tuple):  # pragma: no cover
-            # This handles __divmod__ return.
-            return tuple(
-                Delta.fromtimedelta(item) if isinstance(item, timedelta) else item
-                for item in result
-            )
-        else:  # pragma: no cover
-            return result
-
-    return decorated
+    return default_locale("LC_TIME")
 
 
 def get_locale(locale=None, default="en_US_POSIX"):
     """Return default locale to use if one is not provided."""
     if not locale:
-        locale = default_locale("LC_TIME")
+        locale = _default_locale()
 
         if not locale:
             locale = default
@@ -80,7 +55,15 @@ class Delta(timedelta):
         Returns:
             :class:`.Delta`
         """
-        return cls(seconds=delta.total_seconds())
+        return cls._from_timedelta_fast(delta)
+
+    @classmethod
+    def _from_timedelta_fast(cls, delta):
+        """
+        Return :class:`.Delta` object from a native timedelta object using its already
+        normalized days, seconds, and microseconds.
+        """
+        return timedelta.__new__(cls, delta.days, delta.seconds, delta.microseconds)
 
     def format(
         self,
@@ -129,28 +112,155 @@ class Delta(timedelta):
         """
         return int(float(self))
 
+    # NOTE: The arithmetic methods below delegate to timedelta and then convert any
+    # timedelta result to a Delta built directly from its already normalized fields.
+    # The conversion is inlined in each method to avoid extra Python call frames.
+
+    def __add__(self, other):
+        """Return ``self + other``."""
+        result = timedelta.__add__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __radd__(self, other):
+        """Return ``other + self``."""
+        result = timedelta.__radd__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __sub__(self, other):
+        """Return ``self - other``."""
+        result = timedelta.__sub__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __mul__(self, other):
+        """Return ``self * other``."""
+        result = timedelta.__mul__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __rmul__(self, other):
+        """Return ``other * self``."""
+        result = timedelta.__rmul__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __floordiv__(self, other):
+        """Return ``self // other``."""
+        result = timedelta.__floordiv__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __truediv__(self, other):
+        """Return ``self / other``."""
+        result = timedelta.__truediv__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __mod__(self, other):
+        """Return ``self % other``."""
+        result = timedelta.__mod__(self, other)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __divmod__(self, other):
+        """Return ``divmod(self, other)``."""
+        result = timedelta.__divmod__(self, other)
+
+        if result is NotImplemented:  # pragma: no cover
+            return result
+
+        quotient, remainder = result
+        remainder = timedelta.__new__(
+            type(self), remainder.days, remainder.seconds, remainder.microseconds
+        )
+
+        return quotient, remainder
+
+    def __pos__(self):
+        """Return ``+self``."""
+        result = timedelta.__pos__(self)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __neg__(self):
+        """Return ``-self``."""
+        result = timedelta.__neg__(self)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
+    def __abs__(self):
+        """Return ``abs(self)``."""
+        result = timedelta.__abs__(self)
+
+        if type(result) is timedelta:
+            result = timedelta.__new__(
+                type(self), result.days, result.seconds, result.microseconds
+            )
+
+        return result
+
     def __repr__(self):  # pragma: no cover
         """Return representation of :class:`.Delta`."""
         return "<{0} [{1}]>".format(self.__class__.__name__, self)
 
 
-# See _asdelta() docstring for details on why we are doing this.
-Delta.__add__ = _asdelta(Delta.__add__)
-Delta.__radd__ = _asdelta(Delta.__radd__)
-Delta.__sub__ = _asdelta(Delta.__sub__)
-Delta.__mul__ = _asdelta(Delta.__mul__)
-Delta.__rmul__ = _asdelta(Delta.__rmul__)
-Delta.__floordiv__ = _asdelta(Delta.__floordiv__)
-Delta.__pos__ = _asdelta(Delta.__pos__)
-Delta.__neg__ = _asdelta(Delta.__neg__)
-Delta.__abs__ = _asdelta(Delta.__abs__)
-Delta.__truediv__ = _asdelta(Delta.__truediv__)
-Delta.__mod__ = _asdelta(Delta.__mod__)
-Delta.__divmod__ = _asdelta(Delta.__divmod__)
-# Override timedelta.min/max/resolution with equivalent Delta objects.
-Delta.min = Delta(-999999999)
-Delta.max = Delta(days=999999999, hours=23, minutes=59, seconds=59, microseconds=999999)
-Delta.resolution = Delta(microseconds=1)
+# Override timedelta.min/max/resolution with equivalent Delta objects. These are built
+# from their already normalized (days, seconds, microseconds) values.
+Delta.min = timedelta.__new__(Delta, -999999999, 0, 0)
+Delta.max = timedelta.__new__(Delta, 999999999, 86399, 999999)
+Delta.resolution = timedelta.__new__(Delta, 0, 0, 1)
 
 
 def to_seconds(
@@ -3,8 +3,11 @@ The parser module.
 """
 
 from itertools import groupby
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import re
 
+from babel import Locale
 from babel.dates import (
     LC_TIME,
     format_timedelta as _format_timedelta,
@@ -24,6 +27,15 @@ ISO8601 = "ISO8601"
 TIMESTAMP = "timestamp"
 DEFAULT_PARSE_DATETIME_FORMATS = (ISO8601, TIMESTAMP)
 
+# Canonical subset of ISO-8601 that can be parsed without the iso8601 library.
+ISO8601_FAST_RE = re.compile(
+    r"(\d{4})"
+    r"(?:-(\d{2})"
+    r"(?:-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?(Z|[+-]\d{2}:?\d{2})?)?)?)?\Z",
+    re.ASCII,
+)
+
 
 # Subset of Unicode date field patterns from:
 # https://www.unicode.org/reports/tr35/tr35-dates.html#Date_Field_Symbol_Table
@@ -155,7 +167,12 @@ def _parse_datetime_formats(obj, formats):
 def _parse_datetime_format(obj, format):
     """Parse `obj` as datetime using `format`."""
     if format.upper() == ISO8601:
-        return iso8601.parse_date(obj, default_timezone=None)
+        dt = _parse_iso8601_fast(obj)
+
+        if dt is None:
+            dt = iso8601.parse_date(obj, default_timezone=None)
+
+        return dt
     elif format.lower() == TIMESTAMP:
         return datetime.fromtimestamp(obj, UTC)
     else:
@@ -164,6 +181,57 @@ def _parse_datetime_format(obj, format):
         return datetime.strptime(obj, format)
 
 
+def _parse_iso8601_fast(obj):
+    """
+    Parse the most common ISO-8601 shapes (``YYYY``, ``YYYY-MM``, ``YYYY-MM-DD`` and
+    ``YYYY-MM-DD[T ]HH:MM[:SS[.ffffff]][Z|+HHMM|+HH:MM]``) using a single precompiled
+    regular expression instead of the full ISO-8601 parser. Return ``None`` when `obj`
+    doesn't match one of those shapes so that the caller can fall back to the full
+    parser.
+    """
+    if not isinstance(obj, str):
+        return None
+
+    match = ISO8601_FAST_RE.match(obj)
+
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+
+    try:
+        return datetime(
+            int(year),
+            int(month or 1),
+            int(day or 1),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            microsecond,
+            _fixed_offset(offset) if offset else None,
+        )
+    except ValueError:
+        # Let the full parser produce the error for out-of-range values.
+        return None
+
+
+def _fixed_offset(offset):
+    """Return fixed offset timezone from an ISO-8601 UTC offset string."""
+    if offset == "Z":
+        return timezone.utc
+
+    delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:]))
+
+    if offset[0] == "-":
+        delta = -delta
+
+    if not delta:
+        return timezone.utc
+
+    return timezone(delta)
+
+
 def format_datetime(dt, format=None, tz=None, locale=LC_TIME):
     """
     Return string formatted datetime, `dt`, using format directives or pattern in
@@ -208,11 +276,15 @@ def format_datetime(dt, format=None, tz=None, locale=LC_TIME):
     elif "%" in format:
         return dt.strftime(format)
     else:
-        return _format_datetime(dt, format, locale=locale)
+        return _format_datetime(dt, format, locale=_parse_locale(locale))
 
 
+@lru_cache(maxsize=512)
 def _date_pattern_to_directive(format):
-    """Convert date pattern format to strptime/strftime directives."""
+    """
+    Convert date pattern format to strptime/strftime directives. Conversions are cached
+    since the same handful of patterns are typically used over and over.
+    """
     return "".join(
         DATE_PATTERN_TO_DIRECTIVE.get(token, token)
         for token in _tokenize_date_pattern(format)
@@ -315,10 +387,30 @@ def format_timedelta(
         threshold=threshold,
         add_direction=add_direction,
         format=format,
-        locale=locale,
+        locale=_parse_locale(locale),
     )
 
 
+def _parse_locale(locale):
+    """
+    Return ``babel.Locale`` object for locale identifier, `locale`. Other values are
+    returned as-is.
+    """
+    if isinstance(locale, str):
+        locale = _parse_locale_identifier(locale)
+
+    return locale
+
+
+@lru_cache(maxsize=128)
+def _parse_locale_identifier(identifier):
+    """
+    Return cached ``babel.Locale`` object for `identifier` so that Babel doesn't have
+    to re-parse the identifier and reload its locale data on every call.
+    """
+    return Locale.parse(identifier)
+
+
 def get_timezone(tz):
     """
     Coerce `tz` into a `tzinfo` compatible object. If ``tz == 'local'``, then the
@@ -332,7 +424,7 @@ def get_timezone(tz):
         tz = tzlocal()
     elif isinstance(tz, str):
         tz_string = tz
-        tz = gettz(tz)
+        tz = _gettz(tz)
 
         if tz is None:
             raise ValueError("Unrecognized timezone string: {0}".format(tz_string))
@@ -340,6 +432,12 @@ def get_timezone(tz):
     return tz
 
 
+@lru_cache(maxsize=128)
+def _gettz(name):
+    """Return cached ``dateutil.tz.gettz(name)`` result."""
+    return gettz(name)
+
+
 def get_timestamp(dt):
     """Return timestamp for datetime, `dt`."""
     return (dt - EPOCH).total_seconds()
@@ -5,6 +5,7 @@ The datetime module.
 import calendar
 from collections import namedtuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import time
 
 from babel.dates import LC_TIME
@@ -49,6 +50,12 @@ DateTime = namedtuple(
 )
 Date = namedtuple("Date", ["year", "month", "day"])
 
+# Maximum number of parsed strings to keep in the Zulu.parse() cache.
+PARSE_CACHE_SIZE = 4096
+
+# Maximum number of formatted strings to keep in the Zulu.format() cache.
+FORMAT_CACHE_SIZE = 2048
+
 
 def validate_frame(frame):
     """Method that validates the given time frame."""
@@ -60,6 +67,59 @@ def validate_frame(frame):
         )
 
 
+def _is_cacheable_parse(formats, default_tz):
+    """Return whether a string parse with `formats` and `default_tz` can be cached."""
+    if default_tz is not None and not isinstance(default_tz, str):
+        return False
+
+    if default_tz == LOCAL:
+        # The local timezone can change during runtime so don't cache it.
+        return False
+
+    if formats is None or isinstance(formats, str):
+        return True
+
+    return isinstance(formats, (list, tuple)) and all(
+        isinstance(format, str) for format in formats
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_string(cls, string, formats, default_tz):
+    """
+    Return `cls` object parsed from `string`. Results are memoized since the same
+    strings tend to be parsed repeatedly, so each result is a shared instance.
+    """
+    dt = parser.parse_datetime(string, formats, default_tz=default_tz)
+    return cls.fromdatetime(dt)
+
+
+def _is_cacheable_format(format, tz, locale):
+    """Return whether formatting with `format`, `tz`, and `locale` can be cached."""
+    if not isinstance(format, str) or format == parser.ISO8601:
+        # ISO-8601 formatting is already fast and isn't worth caching.
+        return False
+
+    if tz is not None and (not isinstance(tz, str) or tz == LOCAL):
+        return False
+
+    try:
+        hash(locale)
+    except TypeError:  # pragma: no cover
+        return False
+
+    return True
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_cached(dt, format, tz, locale):
+    """
+    Return `dt` formatted as a string. Results are memoized since the same datetime is
+    often formatted with the same pattern many times (e.g. when logging).
+    """
+    return parser.format_datetime(dt, format, tz=tz, locale=locale)
+
+
 class Zulu(datetime):
     """
     The Zulu class represents an immutable UTC datetime object. Any timezone information
@@ -110,7 +170,7 @@ class Zulu(datetime):
 
         extra = {"fold": fold} if FOLD_AVAILABLE else {}
 
-        if tzinfo:
+        if tzinfo and tzinfo is not UTC:
             # If tzinfo is provided, we first need to create a stdlib datetime with that
             # tzinfo. Then, we need to convert it to UTC and extract the datetime
             # properites from it so we can then create a Zulu datetime object. We use
@@ -146,6 +206,7 @@ class Zulu(datetime):
             if FOLD_AVAILABLE:  # pragma: no cover
                 fold = extra["fold"] = dt.fold
         else:
+            # Share the module's UTC tzinfo so that no timezone resolution is needed.
             tzinfo = UTC
 
         return datetime.__new__(
@@ -177,6 +238,14 @@ class Zulu(datetime):
         """
         Return :class:`.Zulu` object parsed from `obj`.
 
+        Note:
+            Results of parsing strings are cached, so parsing the same string again
+            returns the same shared :class:`.Zulu` instance rather than a new one.
+            Datetime values can't be modified, but any attributes set on a returned
+            instance will be seen by every later caller that parses the same string.
+            Likewise, parsing an instance of `cls` without a `default_tz` returns that
+            same object.
+
         Args:
             obj (mixed): Object to parse into a :class:`.Zulu` object.
             formats (list, optional): List of string formats to use when parsing.
@@ -187,14 +256,70 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        if isinstance(obj, dict):
+        # NOTE: Types are checked in order of how commonly they're parsed so that the
+        # frequent cases short-circuit before reaching the generic parser. The
+        # non-string fast paths are only taken when formats and default_tz can't
+        # affect the result. Anything they can't handle (e.g. an out of range
+        # timestamp) is left to the generic parser so that it raises its usual errors.
+        obj_type = type(obj)
+        dt = None
+
+        if obj_type is str and _is_cacheable_parse(formats, default_tz):
+            if isinstance(formats, list):
+                formats = tuple(formats)
+            dt = _parse_string(cls, obj, formats, default_tz)
+        elif obj_type in (int, float) and formats is None and default_tz is None:
+            try:
+                dt = cls.fromdatetime(datetime.fromtimestamp(obj, UTC))
+            except (OverflowError, OSError, ValueError):
+                pass
+        elif obj_type is cls and default_tz is None:
+            # Datetime values can't be modified so there's nothing to parse.
+            dt = obj
+        elif isinstance(obj, datetime) and default_tz is None:
+            dt = cls.fromdatetime(obj)
+        elif isinstance(obj, dict):
             dt = cls(obj)
-        else:
+
+        if dt is None:
             dt = parser.parse_datetime(obj, formats, default_tz=default_tz)
             dt = cls.fromdatetime(dt)
 
         return dt
 
+    @classmethod
+    def parse_many(cls, objs, formats=None, default_tz=None):
+        """
+        Return list of :class:`.Zulu` objects parsed from each item in `objs`. Duplicate
+        items are only parsed once.
+
+        Args:
+            objs (iterable): Objects to parse into :class:`.Zulu` objects.
+            formats (list, optional): List of string formats to use when parsing.
+                Defaults to ``['ISO8601', 'timestamp']``.
+            default_tz (None|str|tzinfo, optional): Default timezone to use when parsed
+                datetime object does not contain a timezone. Defaults to ``UTC``.
+
+        Returns:
+            list
+        """
+        parsed = {}
+        dts = []
+
+        for obj in objs:
+            try:
+                dt = parsed.get(obj)
+            except TypeError:
+                # Unhashable objects (e.g. dicts) can't be deduplicated.
+                dt = cls.parse(obj, formats, default_tz=default_tz)
+            else:
+                if dt is None:
+                    dt = parsed[obj] = cls.parse(obj, formats, default_tz=default_tz)
+
+            dts.append(dt)
+
+        return dts
+
     @classmethod
     def fromdatetime(cls, dt):
         """
@@ -509,6 +634,9 @@ class Zulu(datetime):
         Returns:
             :class:`str`
         """
+        if _is_cacheable_format(format, tz, locale):
+            return _format_cached(self, format, tz, locale)
+
         return parser.format_datetime(self, format, tz=tz, locale=locale)
 
     def time_from(self, dt, **options):
@@ -14,6 +14,7 @@ parametrize = pytest.mark.parametrize
     [
         (zulu.now, "zulu.zulu.Zulu.now"),
         (zulu.parse, "zulu.zulu.Zulu.parse"),
+        (zulu.parse_many, "zulu.zulu.Zulu.parse_many"),
         (zulu.range, "zulu.zulu.Zulu.range"),
         (zulu.span_range, "zulu.zulu.Zulu.span_range"),
         (zulu.parse_delta, "zulu.delta.Delta.parse"),
@@ -4,6 +4,7 @@ import pickle
 import pytest
 
 from zulu import ParseError, Delta, to_seconds
+from zulu.delta import _default_locale
 
 
 parametrize = pytest.mark.parametrize
@@ -62,6 +63,20 @@ def test_delta_parse(obj, expected):
     assert Delta.parse(obj) == expected
 
 
+@parametrize(
+    "delta",
+    [
+        timedelta(days=1, seconds=2, microseconds=3),
+        timedelta(days=-1, microseconds=1),
+        timedelta(days=100000000, microseconds=1),
+    ],
+)
+def test_delta_fromtimedelta(delta):
+    result = Delta.fromtimedelta(delta)
+    assert isinstance(result, Delta)
+    assert result == delta
+
+
 def test_delta_as_float():
     secs = 10.1234
     delta = Delta(seconds=secs)
@@ -104,7 +119,12 @@ def test_delta_format_default_locale(monkeypatch):
     for var in ("LANGUAGE", "LC_ALL", "LC_CTYPE", "LANG"):
         monkeypatch.setenv(var, "")
 
-    assert Delta(seconds=5).format() == "5 seconds"
+    _default_locale.cache_clear()
+
+    try:
+        assert Delta(seconds=5).format() == "5 seconds"
+    finally:
+        _default_locale.cache_clear()
 
 
 @parametrize(
@@ -120,8 +140,10 @@ def test_delta_math_operations_return_type():
     delta = Delta(days=1, hours=1, minutes=1, seconds=1, microseconds=1)
 
     assert isinstance(delta + delta, Delta)
+    assert isinstance(timedelta(1) + delta, Delta)
     assert isinstance(delta - delta, Delta)
     assert isinstance(delta * 1, Delta)
+    assert isinstance(2 * delta, Delta)
     assert isinstance(delta / 1, Delta)
     assert isinstance(delta // 1, Delta)
     assert isinstance(abs(delta), Delta)
@@ -129,6 +151,8 @@ def test_delta_math_operations_return_type():
     assert isinstance(-delta, Delta)
     assert isinstance(delta % delta, Delta)
     assert isinstance(divmod(delta, delta)[1], Delta)
+    assert timedelta(1) + delta == delta + Delta(days=1)
+    assert 2 * delta == delta + delta
 
 
 def test_delta_pickle():
@@ -2,6 +2,7 @@ from datetime import date, datetime, time, timedelta
 import pickle
 from time import localtime, mktime, struct_time
 
+from babel import Locale
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import gettz, tzlocal, tzutc
 from iso8601 import UTC
@@ -9,7 +10,15 @@ import pytest
 import pytz
 
 from zulu import Zulu, Delta, ParseError, create
-from zulu.parser import DATE_PATTERN_TO_DIRECTIVE, UTC
+from zulu.parser import (
+    DATE_PATTERN_TO_DIRECTIVE,
+    UTC,
+    _parse_locale,
+    _parse_locale_identifier,
+    format_datetime,
+    get_timezone,
+)
+from zulu.zulu import _format_cached
 from zulu.helpers import FOLD_AVAILABLE
 
 
@@ -68,6 +77,19 @@ def test_zulu_now_is_utcnow(factory):
             datetime(2000, 1, 1, 12, 30, 30, tzinfo=UTC),
         ),
         ("2000-01-01T12:30:30-0400", datetime(2000, 1, 1, 16, 30, 30, tzinfo=UTC)),
+        ("2000-01-01T12:30:30-04:00", datetime(2000, 1, 1, 16, 30, 30, tzinfo=UTC)),
+        ("2000-01-01T12:30:30Z", datetime(2000, 1, 1, 12, 30, 30, tzinfo=UTC)),
+        ("2000-01-01T12:30:30-00:00", datetime(2000, 1, 1, 12, 30, 30, tzinfo=UTC)),
+        ("2000-01-01T12:30:30+0000", datetime(2000, 1, 1, 12, 30, 30, tzinfo=UTC)),
+        (
+            "2000-01-01T12:30:30.5+0130",
+            datetime(2000, 1, 1, 11, 0, 30, 500000, tzinfo=UTC),
+        ),
+        (
+            "2000-01-01T12:30:30.123456",
+            datetime(2000, 1, 1, 12, 30, 30, 123456, tzinfo=UTC),
+        ),
+        ("20000101T123030", datetime(2000, 1, 1, 12, 30, 30, tzinfo=UTC)),
         (
             {
                 "year": 2000,
@@ -115,6 +137,100 @@ def test_zulu_parse(obj, expected):
     assert Zulu.parse(obj) == expected
 
 
+@parametrize(
+    "string,kargs",
+    [
+        ("2000-01-01T12:30:45", {}),
+        ("2000-01-01T12:30:45", {"default_tz": "US/Eastern"}),
+        ("2000-01-01", {"formats": ["YYYY-MM-dd"]}),
+        ("2000-01-01", {"formats": ("ISO8601",)}),
+    ],
+)
+def test_zulu_parse_cached(string, kargs):
+    dt = Zulu.parse(string, **kargs)
+    assert Zulu.parse(string, **kargs) is dt
+
+
+def test_get_timezone_cached():
+    tz = get_timezone("US/Eastern")
+    assert get_timezone("US/Eastern") is tz
+
+
+def test_get_timezone_invalid():
+    with pytest.raises(ValueError):
+        get_timezone("invalid")
+
+
+def test_zulu_parse_local_not_cached():
+    dt = Zulu.parse("2000-01-01T12:30:45", default_tz="local")
+    other = Zulu.parse("2000-01-01T12:30:45", default_tz="local")
+    assert other == dt
+    assert other is not dt
+
+
+@parametrize(
+    "objs,kargs,expected",
+    [
+        ([], {}, []),
+        (
+            ["2000-01-01", "2000-01-02", "2000-01-01"],
+            {},
+            [
+                datetime(2000, 1, 1, tzinfo=UTC),
+                datetime(2000, 1, 2, tzinfo=UTC),
+                datetime(2000, 1, 1, tzinfo=UTC),
+            ],
+        ),
+        (
+            iter(["01/01/2000", "01/01/2000"]),
+            {"formats": "MM/dd/YYYY", "default_tz": "US/Eastern"},
+            [datetime(2000, 1, 1, 5, tzinfo=UTC), datetime(2000, 1, 1, 5, tzinfo=UTC)],
+        ),
+        (
+            [0, {"year": 2000}, {"year": 2000}],
+            {},
+            [
+                datetime(1970, 1, 1, tzinfo=UTC),
+                datetime(2000, 1, 1, tzinfo=UTC),
+                datetime(2000, 1, 1, tzinfo=UTC),
+            ],
+        ),
+    ],
+)
+def test_zulu_parse_many(objs, kargs, expected):
+    dts = Zulu.parse_many(objs, **kargs)
+    assert dts == expected
+    assert all(isinstance(dt, Zulu) for dt in dts)
+
+
+def test_zulu_parse_zulu_returns_same_object():
+    dt = Zulu(2000, 1, 1)
+    assert Zulu.parse(dt) is dt
+
+
+@parametrize(
+    "obj,expected",
+    [
+        (datetime(2000, 1, 1), datetime(2000, 1, 1, tzinfo=UTC)),
+        (Zulu(2000, 1, 1), datetime(2000, 1, 1, tzinfo=UTC)),
+    ],
+)
+def test_zulu_parse_datetime_with_default_tz(obj, expected):
+    # Datetime objects are returned as-is by the parser so default_tz isn't applied.
+    assert Zulu.parse(obj, default_tz="US/Eastern") == expected
+
+
+@parametrize("obj", [0, 1.5, datetime(2000, 1, 1), Zulu(2000, 1, 1)])
+def test_zulu_parse_invalid_default_tz(obj):
+    with pytest.raises(ValueError):
+        Zulu.parse(obj, default_tz="invalid")
+
+
+def test_zulu_parse_many_parses_duplicates_once():
+    dts = Zulu.parse_many([0.0, 0.0])
+    assert dts[0] is dts[1]
+
+
 @parametrize(
     "string,kargs,exception",
     [
@@ -128,6 +244,12 @@ def test_zulu_parse(obj, expected):
         ("2000-01-01T00:00:00+2500", {}, ParseError),
         ("2000-01-01T00:00:00-2500", {}, ParseError),
         ("2000-01-01T00:00:00", {"default_tz": "invalid"}, ValueError),
+        (0, {"formats": "ISO8601"}, ParseError),
+        (1e20, {}, ParseError),
+        (10 ** 20, {}, ParseError),
+        (float("inf"), {}, ParseError),
+        (float("nan"), {}, ParseError),
+        (-62135596801, {}, ParseError),
     ],
 )
 def test_zulu_parse_invalid(string, kargs, exception):
@@ -300,6 +422,39 @@ def test_zulu_format(dt, args, expected):
     assert dt.format(**args) == expected
 
 
+@parametrize(
+    "args,cached",
+    [
+        ({"format": "YYYY-MM-dd"}, True),
+        ({"format": "%Y-%m-%d", "tz": "US/Eastern"}, True),
+        ({"format": "YYYY-MM-dd", "locale": "fr"}, True),
+        ({}, False),
+        ({"format": "YYYY-MM-dd", "tz": "local"}, False),
+        ({"format": "YYYY-MM-dd", "tz": tzutc()}, False),
+    ],
+)
+def test_zulu_format_cached(args, cached):
+    dt = Zulu(2000, 1, 1, 12, 30)
+    hits = _format_cached.cache_info().hits
+
+    assert dt.format(**args) == Zulu(2000, 1, 1, 12, 30).format(**args)
+    assert (_format_cached.cache_info().hits > hits) is cached
+
+
+def test_zulu_format_locale_cached():
+    dt = Zulu(2000, 1, 5)
+    expected = format_datetime(dt, "EEEE", locale="fr")
+    hits = _parse_locale_identifier.cache_info().hits
+
+    assert format_datetime(dt, "EEEE", locale="fr") == expected
+    assert _parse_locale_identifier.cache_info().hits > hits
+
+
+def test_parse_locale_passes_locale_object():
+    locale = Locale.parse("fr")
+    assert _parse_locale(locale) is locale
+
+
 @parametrize(
     "dt,fmt,expected",
     [